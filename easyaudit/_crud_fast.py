@@ -0,0 +1,31 @@
+"""Hot-path string helpers for the CRUD signal flows.
+
+Kept free of Django imports and fully typed so the module can be
+compiled as-is with mypyc or Cython for a native-code speedup. The
+package itself ships pure Python (poetry-core has no extension build
+step); projects that want the extra headroom can compile this module
+in place and Python will pick up the compiled version automatically.
+"""
+from typing import Dict, Iterable
+
+
+def strip_action_prefix(action: str) -> str:
+    """Strip the pre_/post_ prefix from an m2m_changed action name."""
+    if action.startswith("pre_"):
+        return action[4:]
+    if action.startswith("post_"):
+        return action[5:]
+    return action
+
+
+def build_cache_keys(
+    class_name: str, pk: str, fields: Iterable[str], action: str
+) -> Dict[str, str]:
+    """Map each field's m2m snapshot cache key to the field name.
+
+    The class/pk prefix and stripped-action sufix are built once and
+    shared across all keys.
+    """
+    prefix = class_name + "_" + pk + "_"
+    sufix = "_" + strip_action_prefix(action)
+    return {prefix + field_name + sufix: field_name for field_name in fields}
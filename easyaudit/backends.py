@@ -6,11 +6,22 @@ logger = logging.getLogger(__name__)
 
 
 class ModelBackend:
+    # Backends that do not write to the audit database inline (e.g. a
+    # Celery enqueue or an in-process buffer) can set this to False so
+    # log_event skips its savepoint.
+    requires_transaction = True
+
     def request(self, request_info):
         return RequestEvent.objects.create(**request_info)
 
     def crud(self, crud_info):
         return CRUDEvent.objects.create(**crud_info)
 
+    def bulk_crud(self, crud_info_list):
+        return CRUDEvent.objects.bulk_create(
+            [CRUDEvent(**crud_info) for crud_info in crud_info_list],
+            batch_size=500,
+        )
+
     def login(self, login_info):
         return LoginEvent.objects.create(**login_info)
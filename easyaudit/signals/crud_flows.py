@@ -1,13 +1,15 @@
 import contextlib
-import json
+import functools
 import logging
+import threading
 
+import orjson
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 from django.contrib.contenttypes.models import ContentType
-from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
+from django.db.models.signals import class_prepared, post_migrate
 from django.utils import timezone
 from django.utils.module_loading import import_string
 
@@ -15,7 +17,8 @@ from django.db.models.query import QuerySet
 
 from django.core.cache import cache
 
-from easyaudit.middleware.easyaudit import get_current_user
+from easyaudit._crud_fast import build_cache_keys
+from easyaudit.middleware.easyaudit import get_current_request, get_current_user
 from easyaudit.models import CRUDEvent
 from easyaudit.settings import DATABASE_ALIAS, LOGGING_BACKEND
 from easyaudit.utils import get_m2m_field_name, should_propagate_exceptions
@@ -23,6 +26,105 @@ from easyaudit.utils import get_m2m_field_name, should_propagate_exceptions
 
 logger = logging.getLogger(__name__)
 audit_logger = import_string(LOGGING_BACKEND)()
+_REQUIRES_TRANSACTION = getattr(audit_logger, "requires_transaction", True)
+
+# orjson options matching Django's datetime handling
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _fast_json_dumps(obj) -> str:
+    """Serialize obj to a JSON string with orjson.
+
+    orjson handles datetime/UUID natively; `default=str` covers the
+    Decimal/lazy types that DjangoJSONEncoder used to.
+    """
+    return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode()
+
+
+# ContentType ids memoized by model class; cheaper than going through
+# the manager's cache + attribute chain on every signal.
+_CT_ID_CACHE: dict = {}
+
+
+def _clear_ct_id_cache(sender, **kwargs):
+    _CT_ID_CACHE.clear()
+
+
+def _clear_class_caches(sender, **kwargs):
+    _CT_ID_CACHE.clear()
+    _m2m_fields_for.cache_clear()
+
+
+class_prepared.connect(_clear_class_caches, dispatch_uid="easy_audit_clear_ct_id_cache")
+# ContentType rows are recreated after a flush (e.g. between tests), so the
+# cached ids must be dropped whenever post_migrate fires.
+post_migrate.connect(
+    _clear_ct_id_cache, dispatch_uid="easy_audit_clear_ct_id_cache_migrate"
+)
+
+
+# Deferred crud flows accumulated at signal time inside an atomic
+# block. They share a single on_commit callback, which runs them with
+# the collector below active so their events land in one bulk insert.
+# A fresh batch is allocated per transaction and closed over by its
+# callback, so a rollback discards the batch together with the
+# callback.
+_pending = threading.local()
+
+
+def _flush_batch(batch):
+    collected = _pending.collected = []
+    try:
+        for crud_flow in batch:
+            crud_flow()
+    finally:
+        _pending.collected = None
+    if not collected:
+        return
+    try:
+        bulk_crud = getattr(audit_logger, "bulk_crud", None)
+        if bulk_crud is not None:
+            bulk_crud(collected)
+        else:
+            # custom backends may only implement the single-event API
+            for event in collected:
+                audit_logger.crud(event)
+    except Exception:
+        logger.exception("easy audit had a flush exception on CRUDEvent creation.")
+        if should_propagate_exceptions():
+            raise
+
+
+def queue_crud_flow(crud_flow, using):
+    """Defer crud_flow until the surrounding transaction commits.
+
+    All flows queued in one transaction share one on_commit callback,
+    so N saves produce a single bulk insert instead of N inserts.
+    """
+    connection = transaction.get_connection(using)
+    if not connection.in_atomic_block:
+        # autocommit: nothing to defer to; run now, as on_commit would
+        crud_flow()
+        return
+    # one batch per atomic level: its flush is registered with the
+    # savepoint ids current at creation, so Django discards the whole
+    # batch if any of those savepoints is rolled back (flows queued
+    # under a deeper savepoint go into their own batch)
+    key = (using, tuple(connection.savepoint_ids))
+    batch, flush, batch_key = getattr(_pending, "batch", (None, None, None))
+    # a rolled-back transaction also drops its on_commit entry but not
+    # this thread-local pointer; only reuse the batch while its flush
+    # is still registered on the connection
+    if (
+        batch is None
+        or batch_key != key
+        or all(entry[1] is not flush for entry in connection.run_on_commit)
+    ):
+        batch = []
+        flush = functools.partial(_flush_batch, batch)
+        _pending.batch = (batch, flush, key)
+        transaction.on_commit(flush, using=using)
+    batch.append(crud_flow)
 
 
 def get_current_user_details():
@@ -33,8 +135,19 @@ def get_current_user_details():
         user = get_current_user()
         if user and not isinstance(user, AnonymousUser):
             if getattr(settings, "DJANGO_EASY_AUDIT_CHECK_IF_REQUEST_USER_EXISTS", True):
-                # validate that the user still exists
+                # validate that the user still exists, once per request;
+                # the memo dies with the request object so no explicit
+                # clearing is needed
+                request = get_current_request()
+                cached = getattr(request, "_easyaudit_validated_user", None)
+                if cached is not None and cached[0] == user.pk:
+                    return cached[1]
                 user = get_user_model().objects.get(pk=user.pk)
+                if request is not None:
+                    request._easyaudit_validated_user = (
+                        user.pk,
+                        (user.id, str(user.pk)),
+                    )
             user_id, user_pk_as_string = user.id, str(user.pk)
 
     return user_id, user_pk_as_string
@@ -42,30 +155,52 @@ def get_current_user_details():
 
 def log_event(event_type, instance, object_id, object_json_repr, **kwargs):
     user_id, user_pk_as_string = get_current_user_details()
-    with transaction.atomic(using=DATABASE_ALIAS):
-        audit_logger.crud(
-            {
-                "content_type_id": ContentType.objects.get_for_model(instance).id,
-                "datetime": timezone.now(),
-                "event_type": event_type,
-                "object_id": object_id,
-                "object_json_repr": object_json_repr or "",
-                "object_repr": str(instance),
-                "user_id": user_id,
-                "user_pk_as_string": user_pk_as_string,
-                **kwargs,
-            }
-        )
+    cls = type(instance)
+    ct_id = _CT_ID_CACHE.get(cls) or _CT_ID_CACHE.setdefault(
+        cls, ContentType.objects.get_for_model(instance).id
+    )
+    crud_info = {
+        "content_type_id": ct_id,
+        "datetime": timezone.now(),
+        "event_type": event_type,
+        "object_id": object_id,
+        "object_json_repr": object_json_repr or "",
+        "object_repr": str(instance),
+        "user_id": user_id,
+        "user_pk_as_string": user_pk_as_string,
+        **kwargs,
+    }
+
+    collected = getattr(_pending, "collected", None)
+    if collected is not None:
+        # running inside a batch flush; the flush bulk-inserts these
+        collected.append(crud_info)
+    elif _REQUIRES_TRANSACTION:
+        with transaction.atomic(using=DATABASE_ALIAS):
+            audit_logger.crud(crud_info)
+    else:
+        # async/buffered backends don't touch the audit DB here; the
+        # savepoint would be two wasted SQL roundtrips
+        audit_logger.crud(crud_info)
 
 
 def handle_flow_exception(instance, signal):
-    instance_str = ""
-    with contextlib.suppress(Exception):
-        instance_str = f" instance: {instance}, instance pk: {instance.pk}"
-
-    logger.exception(
-        f"easy audit had a {signal} exception on CRUDEvent creation.{instance_str}"
-    )
+    if logger.isEnabledFor(logging.ERROR):
+        # str(instance) can be expensive (it may hit the DB) or raise on
+        # a broken instance, so resolve it here — only when the record
+        # will be emitted — and keep the record even if it fails
+        instance_repr = None
+        instance_pk = None
+        with contextlib.suppress(Exception):
+            instance_repr = str(instance)
+            instance_pk = instance.pk
+        logger.exception(
+            "easy audit had a %s exception on CRUDEvent creation."
+            " instance: %s, instance pk: %s",
+            signal,
+            instance_repr,
+            instance_pk,
+        )
     if should_propagate_exceptions():
         raise
 
@@ -95,40 +230,67 @@ def post_save_crud_flow(instance, object_json_repr):
         handle_flow_exception(instance, "post_save")
 
 
-def get_m2m_field_values(model, instance) -> dict:
+@functools.lru_cache(maxsize=512)
+def _m2m_fields_for(cls, m2m_field):
+    """Audit fields of cls tracking sub-fields of m2m_field, keyed by sufix.
+
+    audit_log_fields is static per class, so the scan runs once.
+    """
+    fields = [field for field in cls.audit_log_fields if f'{m2m_field}+' in field]
+
+    # use field after +__
+    return {field: "".join(field.split('+__')[1:]) for field in fields}
+
+
+def get_m2m_field_values(model, instance, m2m_field=None) -> dict:
     field_values = {}
 
-    m2m_field: str = get_m2m_field_name(model, instance)
+    if m2m_field is None:
+        m2m_field: str = get_m2m_field_name(model, instance)
 
     saved_values: QuerySet = getattr(instance, m2m_field).all().order_by('pk')
 
-    fields = [field for field in instance.audit_log_fields if f'{m2m_field}+' in field]
-
-    for field in fields:
-        sufix_field = field.split('+__')[1:]  # use field after +__
-        field_values[field] = list(saved_values.values_list("".join(sufix_field), flat=True))
+    sufix_fields = _m2m_fields_for(type(instance), m2m_field)
+
+    if len(sufix_fields) == 1:
+        field, sufix = next(iter(sufix_fields.items()))
+        field_values[field] = list(saved_values.values_list(sufix, flat=True))
+    elif any("__" in sufix for sufix in sufix_fields.values()):
+        # a sub-field crossing another relation can fan out the joined
+        # rows; keep per-field queries so the fan-out stays isolated to
+        # the path that causes it
+        for field, sufix in sufix_fields.items():
+            field_values[field] = list(saved_values.values_list(sufix, flat=True))
+    elif sufix_fields:
+        # one SELECT for all tracked sub-fields instead of one per field
+        rows = list(saved_values.values(*set(sufix_fields.values())))
+        for field, sufix in sufix_fields.items():
+            field_values[field] = [row[sufix] for row in rows]
 
     return field_values
 
 
-def _cache_key(instance, field_name, action) -> str:
-    action = action.removeprefix('pre_').removeprefix('post_')
-    return f'{instance.__class__.__name__}_{instance.pk}_{field_name}_{action}'
+def _cache_keys_for(instance, fields, action) -> dict:
+    return build_cache_keys(type(instance).__name__, str(instance.pk), fields, action)
+
 
 def cache_m2m_field(model, instance, action):
 
     field_values = get_m2m_field_values(model, instance)
 
-    for field_name, field_values in field_values.items():
-        cache.set(_cache_key(instance, field_name, action), field_values, 30)
+    keys = _cache_keys_for(instance, field_values, action)
+
+    mapping = {key: field_values[field_name] for key, field_name in keys.items()}
+    if mapping:
+        cache.set_many(mapping, 30)
 
 
 def get_cached_m2m_field(instance, fields, action):
-    field_values = {}
-    for field_name in fields:
-        field_values[field_name] = cache.get(_cache_key(instance, field_name, action))
+    keys = _cache_keys_for(instance, fields, action)
 
-    return field_values
+    cached = cache.get_many(keys)
+
+    return {field_name: cached.get(key) for key, field_name in keys.items()}
 
 
 def m2m_changed_crud_flow(  # noqa: PLR0913
@@ -139,17 +301,15 @@ def m2m_changed_crud_flow(  # noqa: PLR0913
             changed_fields = []
 
         else:
-            new_values = get_m2m_field_values(model, instance)
+            field_name = get_m2m_field_name(model, instance)
+
+            new_values = get_m2m_field_values(model, instance, field_name)
 
             old_values = get_cached_m2m_field(instance, new_values.keys(), action)
 
-            changed_fields = json.dumps(
-                {get_m2m_field_name(model, instance): [old_values, new_values]},
-                cls=DjangoJSONEncoder,
-            )
-            # changed_fields = json.dumps(
-            #     {get_m2m_field_name(model, instance): list(pk_set)},
-            #     cls=DjangoJSONEncoder,
+            changed_fields = _fast_json_dumps({field_name: [old_values, new_values]})
+            # changed_fields = _fast_json_dumps(
+            #     {get_m2m_field_name(model, instance): list(pk_set)}
             # )
         log_event(
             event_type,
@@ -38,7 +38,7 @@ from .crud_flows import (
     post_delete_crud_flow,
     post_save_crud_flow,
     pre_save_crud_flow,
-
+    queue_crud_flow,
 )
 
 
@@ -195,9 +195,10 @@ def pre_save(sender, instance, raw, using, update_fields, **kwargs):
         if not should_audit(instance):
             return False
 
+        crud_flow = None
         with transaction.atomic(using=using):
             try:
-                # object_json_repr = serializers.serialize("json", [instance])                
+                # object_json_repr = serializers.serialize("json", [instance])
                 object_json_repr = _serialize_instance(instance)
             except Exception:
                 # We need a better way for this to work. ManyToMany will fail on pre_save on create
@@ -233,10 +234,14 @@ def pre_save(sender, instance, raw, using, update_fields, **kwargs):
                     changed_fields=json.dumps(delta),
                 )
 
-                if getattr(settings, "TEST", False):
-                    crud_flow()
-                else:
-                    transaction.on_commit(crud_flow, using=using)
+        # dispatch outside our own atomic block, so the deferred flow
+        # is tied to the caller's transaction (if any), not to the
+        # bookkeeping savepoint above
+        if crud_flow is not None:
+            if getattr(settings, "TEST", False):
+                crud_flow()
+            else:
+                queue_crud_flow(crud_flow, using)
     except Exception:
         handle_signal_exception("pre_save")
 
@@ -250,6 +255,7 @@ def post_save(sender, instance, created, raw, using, update_fields, **kwargs):
         if not should_audit(instance):
             return False
 
+        crud_flow = None
         with transaction.atomic(using=using):
             try:
                 object_json_repr = _serialize_instance(instance)
@@ -268,10 +274,12 @@ def post_save(sender, instance, created, raw, using, update_fields, **kwargs):
                     instance=instance,
                     object_json_repr=object_json_repr,
                 )
-                if getattr(settings, "TEST", False):
-                    crud_flow()
-                else:
-                    transaction.on_commit(crud_flow, using=using)
+
+        if crud_flow is not None:
+            if getattr(settings, "TEST", False):
+                crud_flow()
+            else:
+                queue_crud_flow(crud_flow, using)
     except Exception:
         handle_signal_exception("post_save")
 
@@ -346,10 +354,11 @@ def m2m_changed(sender, instance, action, reverse, model, pk_set, using, **kwarg
                 event_type=event_type,
                 object_json_repr=object_json_repr,
             )
-            if getattr(settings, "TEST", False):
-                crud_flow()
-            else:
-                transaction.on_commit(crud_flow, using=using)
+
+        if getattr(settings, "TEST", False):
+            crud_flow()
+        else:
+            queue_crud_flow(crud_flow, using)
     except Exception:
         handle_signal_exception("m2m-changed")
 
@@ -374,13 +383,11 @@ def post_delete(sender, instance, using, **kwargs):
                 object_id=object_id,
                 object_json_repr=object_json_repr,
             )
-            if getattr(settings, "TEST", False):
-                crud_flow()
-            else:
-                transaction.on_commit(
-                    crud_flow,
-                    using=using,
-                )
+
+        if getattr(settings, "TEST", False):
+            crud_flow()
+        else:
+            queue_crud_flow(crud_flow, using)
     except Exception:
         handle_signal_exception("post-delete")
 
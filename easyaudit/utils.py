@@ -1,20 +1,24 @@
 import datetime as dt
+import functools
 import json
+from operator import attrgetter
 
 from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import NOT_PROVIDED, DateTimeField
+from django.db.models import NOT_PROVIDED, DateTimeField, FileField
+from django.db.models.signals import class_prepared
 from django.utils import timezone
 from django.utils.encoding import smart_str
-from django.db.models.query import QuerySet
 from django.db.models.manager import Manager
 
+try:
+    from pint import Quantity
+except ModuleNotFoundError:
+    Quantity = None
 
-def get_audit_log_fields(instance_or_class):
-    """Get the audit fields for a model instance.
 
-    :param instance: The model instance or model class.
-    """
+@functools.lru_cache(maxsize=None)
+def _audit_log_fields_for(cls):
     audit_log_fields = set()
     audit_log_fields_exclude = set()
 
@@ -23,8 +27,8 @@ def get_audit_log_fields(instance_or_class):
     # This may include fields that are related to other models
     # when using the "__" syntax
     # like: audit_log_fields = {"field1", "field2", "related_model__field3"}
-    if hasattr(instance_or_class, "audit_log_fields"):
-        audit_log_fields.update(instance_or_class.audit_log_fields)
+    if hasattr(cls, "audit_log_fields"):
+        audit_log_fields.update(cls.audit_log_fields)
     else:
         # if no audit_log_fields attribute is defined,
         # add all fields to audit_log_fields set
@@ -34,21 +38,61 @@ def get_audit_log_fields(instance_or_class):
     # to audit_log_fields set
     if "*" in audit_log_fields:
         audit_log_fields.update(
-            field.name for field in instance_or_class._meta.fields
+            field.name for field in cls._meta.fields
         )
         audit_log_fields.remove("*")
 
     # update exclude set with all fields explicitly defined
     # in the audit_log_fields_exclude attribute
-    if hasattr(instance_or_class, "audit_log_fields_exclude"):
+    if hasattr(cls, "audit_log_fields_exclude"):
         audit_log_fields_exclude.update(
-            instance_or_class.audit_log_fields_exclude
+            cls.audit_log_fields_exclude
         )
 
-    return audit_log_fields - audit_log_fields_exclude
+    return frozenset(audit_log_fields - audit_log_fields_exclude)
+
+
+def get_audit_log_fields(instance_or_class):
+    """Get the audit fields for a model instance.
+
+    :param instance: The model instance or model class.
+    """
+    if not isinstance(instance_or_class, type):
+        instance_or_class = type(instance_or_class)
+    return _audit_log_fields_for(instance_or_class)
+
+
+def _clear_class_caches(sender, **kwargs):
+    _audit_log_fields_for.cache_clear()
+    _model_delta_fields.cache_clear()
+    _make_field_getter.cache_clear()
+    _m2m_field_name_cached.cache_clear()
+
+
+class_prepared.connect(_clear_class_caches, dispatch_uid="easy_audit_clear_utils_caches")
+
+
+_JSON_PRIMITIVES = (str, int, float, bool, type(None))
+_MAX_JSONABLE_DEPTH = 10
 
 
-def is_jsonable(x):
+def is_jsonable(x, _depth=0):
+    # cheap isinstance checks cover the overwhelmingly common types
+    # without serializing (and discarding) the whole object
+    if isinstance(x, _JSON_PRIMITIVES):
+        return True
+    # only a positive fast-path answer is conclusive: json.dumps coerces
+    # some values the checks reject (e.g. int dict keys), so anything
+    # else falls through to the trial dumps below
+    if _depth < _MAX_JSONABLE_DEPTH:
+        if isinstance(x, (list, tuple)):
+            if all(is_jsonable(item, _depth + 1) for item in x):
+                return True
+        elif isinstance(x, dict) and all(
+            isinstance(key, str) and is_jsonable(value, _depth + 1)
+            for key, value in x.items()
+        ):
+            return True
     try:
         json.dumps(x)
         return True
@@ -56,6 +100,65 @@ def is_jsonable(x):
         return False
 
 
+def _make_dt_getter(field, name, default):
+    def _dt_getter(obj):
+        # DateTimeFields are timezone-aware, so we need to convert the
+        # field to its naive form before we can accurately compare them
+        # for changes.
+        try:
+            value = field.to_python(getattr(obj, name, None))
+            if value is not None and settings.USE_TZ and not timezone.is_naive(value):
+                value = timezone.make_naive(value, timezone=dt.timezone.utc)
+        except ObjectDoesNotExist:
+            value = default
+        return value
+
+    return _dt_getter
+
+
+def _make_pint_getter(field, name, default):
+    def _pint_getter(obj):
+        try:
+            value = getattr(obj, name, None)
+            if isinstance(value, Quantity):
+                value = value.to(field.units)
+            value = _fast_smart_str(value)
+        except ObjectDoesNotExist:
+            value = default
+        return value
+
+    return _pint_getter
+
+
+def _make_plain_getter(name, default):
+    def _plain_getter(obj):
+        try:
+            value = _fast_smart_str(getattr(obj, name, None))
+        except ObjectDoesNotExist:
+            value = default
+        return value
+
+    return _plain_getter
+
+
+@functools.lru_cache(maxsize=4096)
+def _make_field_getter(field):
+    """Build a getter specialized for the field's type.
+
+    The DateTimeField/pint dispatch in get_field_value is fixed per
+    field, so it is resolved once here instead of on every call.
+    """
+    name = field.name
+    default = getattr(field, "default", NOT_PROVIDED)
+    default = None if default is NOT_PROVIDED else default
+
+    if isinstance(field, DateTimeField):
+        return _make_dt_getter(field, name, default)
+    if Quantity is not None and hasattr(field, "units"):
+        return _make_pint_getter(field, name, default)
+    return _make_plain_getter(name, default)
+
+
 def get_field_value(obj, field):
     """Get the value of a given model instance field.
 
@@ -66,32 +169,37 @@ def get_field_value(obj, field):
     :return: The value of the field as a string.
     :rtype: str
     """
-    if isinstance(field, DateTimeField):
-        # DateTimeFields are timezone-aware, so we need to convert the field
-        # to its naive form before we can accurately compare them for changes.
-        try:
-            value = field.to_python(getattr(obj, field.name, None))
-            if value is not None and settings.USE_TZ and not timezone.is_naive(value):
-                value = timezone.make_naive(value, timezone=dt.timezone.utc)
-        except ObjectDoesNotExist:
-            value = field.default if field.default is not NOT_PROVIDED else None
-    else:
-        try:
+    return _make_field_getter(field)(obj)
 
-            try:
-                from pint import Quantity
-                value = getattr(obj, field.name, None)
-                if isinstance(value, Quantity):                    
-                    value = value.to(field.units)
-            except ModuleNotFoundError:
-                value = smart_str(getattr(obj, field.name, None))
 
-            value = smart_str(value)
+def _fast_smart_str(value):
+    # values on the audit hot path are overwhelmingly str already;
+    # skip smart_str's force_str chain for those (smart_str returns
+    # str subclasses unchanged as well, so this is behavior-neutral)
+    return value if isinstance(value, str) else smart_str(value)
 
-        except ObjectDoesNotExist:
-            value = field.default if field.default is not NOT_PROVIDED else None
 
-    return value
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=None)
+def _model_delta_fields(model_cls):
+    """Per-class tuple of (name, getter, cheap_compare) iterated by model_delta.
+
+    cheap_compare flags fields whose raw attribute values can be compared
+    with == directly; DateTimeField (tz normalization) and FileField
+    (FieldFile wrappers) always go through the getter.
+    """
+    exclude = getattr(model_cls, "audit_log_fields_exclude", ())
+    return tuple(
+        (
+            field.name,
+            _make_field_getter(field),
+            not isinstance(field, (DateTimeField, FileField)),
+        )
+        for field in model_cls._meta.get_fields()
+        if field.name not in exclude
+    )
 
 
 def model_delta(old_model, new_model):
@@ -106,19 +214,30 @@ def model_delta(old_model, new_model):
              as value.
     :rtype: dict
     """
-    delta = {}
-    
-    if hasattr(new_model, 'audit_log_fields_exclude'):
-        fields = list(field for field in new_model._meta.get_fields() if field.name not in new_model.audit_log_fields_exclude)    
+    if old_model is new_model:
+        return None
 
-    else:
-        fields = new_model._meta.get_fields()
+    delta = {}
 
-    for field in fields:
-        old_value = get_field_value(old_model, field)
-        new_value = get_field_value(new_model, field)
+    # bind both instance dicts once; the loop below reads them per field
+    old_dict = old_model.__dict__
+    new_dict = new_model.__dict__
+
+    for name, getter, cheap_compare in _model_delta_fields(type(new_model)):
+        # identical or equal raw attribute values cannot produce a
+        # difference; skip before paying for the getter/smart_str path
+        old_raw = old_dict.get(name, _MISSING)
+        if old_raw is not _MISSING:
+            new_raw = new_dict.get(name, _MISSING)
+            if old_raw is new_raw or (
+                cheap_compare and new_raw is not _MISSING and old_raw == new_raw
+            ):
+                continue
+
+        old_value = getter(old_model)
+        new_value = getter(new_model)
         if old_value != new_value:
-            delta[field.name] = [smart_str(old_value), smart_str(new_value)]
+            delta[name] = [_fast_smart_str(old_value), _fast_smart_str(new_value)]
 
     # m2m_fields = {relation for relation in new_model.audit_log_fields if '+' in relation}
     # for field in m2m_fields:
@@ -126,57 +245,68 @@ def model_delta(old_model, new_model):
     #     new_value = _get_m2m_values(new_model, field)
     #     if old_value != new_value:
     #         delta[field] = [old_value, new_value]
-    
+
     if len(delta) == 0:
         delta = None
 
     return delta
 
 
-def _get_m2m_values(instance, m2m_field) -> str:
-    """
-    Serialize the audit fields of the instance
-    if field has a __ in it, it will be treated as a nested field
-    """
-
-    def _recursive_getattr(obj, field: str):
-        
-        if not field:
-            return obj
-        
-        fields = field.split("__")
+def _resolve_m2m_path(obj, path: str):
+    while path:
+        fields = path.split("__")
 
         first_field = fields.pop(0)
 
-        # If there is a * denoting a Many-to-Many relationship
-        if '+' in first_field:
-            first_field = first_field.replace('+', '')
-
-            obj = getattr(obj, first_field)
+        path = "__".join(fields)
 
-            children = []
-            children_field_values = []
+        # If there is a + denoting a Many-to-Many relationship
+        if "+" in first_field:
+            obj = getattr(obj, first_field.replace("+", ""))
 
             if isinstance(obj, Manager):
-                children: QuerySet = obj.all().order_by('pk')[:50]
-            elif isinstance(obj, QuerySet):
-                children = obj
+                obj = obj.all().order_by("pk")
 
-            for obj in children:
-                children_field_values.append(_recursive_getattr(obj, "__".join(fields)))
+            if "+" in path:
+                # another m2m hop below: resolve per child to keep nesting
+                return [_resolve_m2m_path(child, path) for child in obj[:50]]
+            if path:
+                # let the DB do the join and fetch the leaf values at once
+                return list(obj.values_list(path, flat=True)[:50])
+            return list(obj[:50])
 
-            return children_field_values
+        obj = getattr(obj, first_field)
 
-        else:
-            obj = getattr(obj, first_field)
+    return obj
 
-            return _recursive_getattr(obj, "__".join(fields))
 
-    field_value = _recursive_getattr(instance, m2m_field)
+def _get_m2m_values(instance, m2m_field) -> str:
+    """
+    Serialize the audit fields of the instance
+    if field has a __ in it, it will be treated as a nested field
+    """
+    if "+" in m2m_field:
+        field_value = _resolve_m2m_path(instance, m2m_field)
+    else:
+        field_value = attrgetter(m2m_field.replace("__", "."))(instance)
 
     return str(field_value)
 
 
+@functools.lru_cache(maxsize=512)
+def _m2m_field_name_cached(model, instance_cls):
+    try:
+        for x in model._meta.related_objects:
+            # compare classes directly; instantiating related_model()
+            # per candidate runs field defaults and is needlessly slow
+            if x.related_model is instance_cls and x.many_to_many:
+                return x.remote_field.name
+        return None
+
+    except Exception:
+        return None
+
+
 def get_m2m_field_name(model, instance):
     """Find M2M field name on instance.
 
@@ -188,14 +318,7 @@ def get_m2m_field_name(model, instance):
     :return: ManyToManyField name of instance related to model.
     :rtype: str
     """
-    try:
-        for x in model._meta.related_objects:
-            if x.related_model().__class__ == instance.__class__ and x.many_to_many:
-                return x.remote_field.name
-        return None
-
-    except Exception:
-        return None
+    return _m2m_field_name_cached(model, type(instance))
 
 
 def should_propagate_exceptions():
@@ -1,16 +1,27 @@
+import contextlib
 import json
 
 import pytest
 from asgiref.sync import sync_to_async
 from django.contrib.contenttypes.models import ContentType
 from django.core import management
+from django.core.cache import cache
 from django.db import transaction
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.version import get_version
 from pytest_django.asserts import assertInHTML
 
+from easyaudit.backends import ModelBackend
 from easyaudit.middleware.easyaudit import clear_request, set_current_user
 from easyaudit.models import CRUDEvent, RequestEvent
+from easyaudit.signals.crud_flows import (
+    _m2m_fields_for,
+    audit_logger,
+    cache_m2m_field,
+    get_cached_m2m_field,
+    get_current_user_details,
+)
 from tests.test_app.models import (
     BigIntForeignKeyModel,
     BigIntM2MModel,
@@ -252,6 +263,149 @@ class TestAuditBigIntModels(TestAuditModels):
         return BigIntM2MModel
 
 
+@pytest.mark.django_db(transaction=True)
+class TestBatchedCRUDEvents:
+    def test_flush_on_commit(self, settings):
+        settings.TEST = False
+
+        with transaction.atomic():
+            Model.objects.create()
+            Model.objects.create()
+            assert CRUDEvent.objects.count() == 0
+
+        assert CRUDEvent.objects.count() == 2
+
+    def test_flush_is_one_bulk_insert(self, settings, monkeypatch):
+        settings.TEST = False
+
+        batch_sizes = []
+        original_bulk_crud = audit_logger.bulk_crud
+
+        def _counting_bulk_crud(batch):
+            batch_sizes.append(len(batch))
+            return original_bulk_crud(batch)
+
+        monkeypatch.setattr(audit_logger, "bulk_crud", _counting_bulk_crud)
+
+        with transaction.atomic():
+            for _ in range(3):
+                Model.objects.create()
+
+        assert batch_sizes == [3]
+        assert CRUDEvent.objects.count() == 3
+
+    def test_savepoint_rollback_discards_only_inner_events(self, settings):
+        settings.TEST = False
+
+        with transaction.atomic():
+            outer = Model.objects.create()
+            with contextlib.suppress(RuntimeError), transaction.atomic():
+                Model.objects.create()
+                raise RuntimeError("boom")
+            after = Model.objects.create()
+
+        logged_ids = {event.object_id for event in CRUDEvent.objects.all()}
+        assert logged_ids == {str(outer.pk), str(after.pk)}
+
+    def test_rollback_discards_batch(self, settings):
+        settings.TEST = False
+
+        def _create_and_fail():
+            with transaction.atomic():
+                Model.objects.create()
+                raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            _create_and_fail()
+
+        assert CRUDEvent.objects.count() == 0
+
+        # a later transaction on the same thread must still flush
+        with transaction.atomic():
+            Model.objects.create()
+
+        assert CRUDEvent.objects.count() == 1
+
+
+@pytest.mark.django_db
+class TestModelBackendBulk:
+    def test_bulk_crud(self):
+        obj = Model.objects.create()
+        CRUDEvent.objects.all().delete()
+        ct_id = ContentType.objects.get_for_model(obj).id
+
+        crud_info = {
+            "content_type_id": ct_id,
+            "datetime": timezone.now(),
+            "event_type": CRUDEvent.UPDATE,
+            "object_id": obj.pk,
+            "object_json_repr": "",
+            "object_repr": str(obj),
+            "user_id": None,
+            "user_pk_as_string": "",
+        }
+        ModelBackend().bulk_crud(
+            [
+                crud_info,
+                {**crud_info, "changed_fields": '{"name": ["a", "b"]}'},
+            ]
+        )
+
+        crud_event_qs = CRUDEvent.objects.filter(object_id=obj.pk, content_type_id=ct_id)
+        assert crud_event_qs.count() == 2
+        assert crud_event_qs.exclude(changed_fields="").count() == 1
+
+
+@pytest.mark.django_db
+class TestUserValidationCache:
+    def test_existence_check_runs_once_per_request(self, user, django_assert_num_queries):
+        set_current_user(user)
+        try:
+            with django_assert_num_queries(1):
+                details = get_current_user_details()
+            assert details == (user.id, str(user.pk))
+
+            with django_assert_num_queries(0):
+                assert get_current_user_details() == details
+        finally:
+            clear_request()
+
+        # a new request revalidates
+        set_current_user(user)
+        try:
+            with django_assert_num_queries(1):
+                assert get_current_user_details() == details
+        finally:
+            clear_request()
+
+
+@pytest.mark.django_db
+class TestM2MSnapshotCache:
+    @pytest.fixture
+    def tracked_m2m_model(self, monkeypatch):
+        cache.clear()
+        monkeypatch.setattr(
+            M2MModel, "audit_log_fields", {"test_m2m+__name"}, raising=False
+        )
+        yield M2MModel
+        _m2m_fields_for.cache_clear()
+
+    def test_round_trip(self, tracked_m2m_model):
+        related = Model.objects.create(name="first")
+        obj = tracked_m2m_model.objects.create(name="holder")
+        obj.test_m2m.add(related)
+
+        cache_m2m_field(Model, obj, "pre_remove")
+        cached = get_cached_m2m_field(obj, ["test_m2m+__name"], "post_remove")
+        assert cached == {"test_m2m+__name": ["first"]}
+
+    def test_missing_keys_come_back_as_none(self, tracked_m2m_model):
+        obj = tracked_m2m_model.objects.create(name="holder")
+
+        cached = get_cached_m2m_field(obj, ["test_m2m+__name"], "post_add")
+        assert cached == {"test_m2m+__name": None}
+
+
 @pytest.mark.django_db
 class TestMiddleware:
     def test_middleware_logged_in(self, user, client, username, password):